@@ -0,0 +1,189 @@
+"""
+Asynchronous batch scraping of several dates at once.
+
+Pages are downloaded concurrently over a single HTTP/2 client, and the
+CPU-bound parsing is handed to a process pool so it runs outside the
+event loop and the GIL.
+
+This module is a batch API for one-off multi-date scrapes. The polling loop
+in ``main.py`` runs the synchronous ``Scraper``, which is the supported path
+for the application.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+
+from app.models import Item
+from app.scraper import (
+    BACKOFF_FACTOR,
+    PAGE_ENCODING,
+    RETRY_STATUS_CODES,
+    TOTAL_RETRIES,
+    Scraper,
+    parse_page,
+)
+from app.settings import get_logger
+from app.utils import get_random_user_agent
+
+logger = get_logger('async_scraper')
+
+# Retries of failed connections made by the transport, before any response is received
+CONNECT_RETRIES = 3
+
+
+def get_async_client(max_connections: int = 64) -> httpx.AsyncClient:
+    """Create an HTTP/2 client that sends a user agent picked for this client.
+
+    The transport only retries failed connections; retries on HTTP status codes
+    are handled by ``fetch``.
+
+    Args:
+        max_connections (int): Maximum number of concurrent connections
+
+    Returns:
+        httpx.AsyncClient: Configured asynchronous client
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=CONNECT_RETRIES,
+        limits=httpx.Limits(max_connections=max_connections),
+    )
+    return httpx.AsyncClient(headers={'User-Agent': get_random_user_agent()}, transport=transport)
+
+
+def get_parse_executor(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """Create a process pool to parse pages with ``parse_page``.
+
+    Args:
+        max_workers (int | None): Number of worker processes, defaults to the CPU count
+
+    Returns:
+        ProcessPoolExecutor: Pool to pass to ``scrape_dates``
+    """
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+async def fetch(client: httpx.AsyncClient, date: str) -> httpx.Response:
+    """Fetch the betting data page for a given date.
+
+    Responses with a status in ``RETRY_STATUS_CODES`` are retried up to
+    ``TOTAL_RETRIES`` times with exponential backoff, like the synchronous session.
+
+    Args:
+        client (httpx.AsyncClient): Client used to send the request
+        date (str): Date formatted as MM-DD-YYYY
+
+    Returns:
+        httpx.Response: HTTP response with the odds table
+
+    Raises:
+        httpx.HTTPStatusError: If the status is still retryable after the last retry
+    """
+    url = Scraper.index_url.format(date=date)
+    logger.debug('Fetching data from: {url}', url=url)
+    response = await client.get(url)
+    retry_number = 0
+    while response.status_code in RETRY_STATUS_CODES:
+        if retry_number == TOTAL_RETRIES:
+            response.raise_for_status()
+        retry_number += 1
+        backoff_time = _get_backoff_time(response, retry_number)
+        logger.warning(
+            'Received status code {status_code}, retrying in {backoff_time:g}s '
+            '({retry_number}/{total_retries})',
+            status_code=response.status_code,
+            backoff_time=backoff_time,
+            retry_number=retry_number,
+            total_retries=TOTAL_RETRIES,
+        )
+        await asyncio.sleep(backoff_time)
+        response = await client.get(url)
+    response.encoding = PAGE_ENCODING
+
+    if response.status_code != httpx.codes.OK:
+        logger.warning(
+            'Received non-200 status code: {status_code}', status_code=response.status_code
+        )
+
+    return response
+
+
+def _get_backoff_time(response: httpx.Response, retry_number: int) -> float:
+    """Compute how long to wait before a retry, following urllib3's ``Retry``.
+
+    A ``Retry-After`` header given in seconds takes precedence over the backoff.
+
+    Args:
+        response (httpx.Response): Response that triggered the retry
+        retry_number (int): Number of the upcoming retry, starting at 1
+
+    Returns:
+        float: Seconds to wait before sending the request again
+    """
+    retry_after = response.headers.get('Retry-After', '')
+    if retry_after.isdigit():
+        return float(retry_after)
+    # No wait before the first retry, then backoff_factor * 2 ** (retry_number - 1)
+    if retry_number <= 1:
+        return 0.0
+    return float(BACKOFF_FACTOR * 2 ** (retry_number - 1))
+
+
+async def scrape_date(client: httpx.AsyncClient, date: str) -> list[Item]:
+    """Fetch one date and parse the page in a thread, off the event loop.
+
+    Args:
+        client (httpx.AsyncClient): Client used to send the request
+        date (str): Date formatted as MM-DD-YYYY
+
+    Returns:
+        list[Item]: Betting items extracted from the page
+    """
+    logger.info('Starting scraping process')
+    response = await fetch(client, date)
+    items = await asyncio.to_thread(parse_page, response.content)
+    logger.info('Scraping completed, {count} items extracted', count=len(items))
+    return items
+
+
+async def scrape_dates(
+    client: httpx.AsyncClient, dates: list[str], executor: ProcessPoolExecutor
+) -> list[Item]:
+    """Fetch all dates concurrently and parse the pages in the process pool.
+
+    Args:
+        client (httpx.AsyncClient): Client used to send the requests
+        dates (list[str]): Dates formatted as MM-DD-YYYY
+        executor (ProcessPoolExecutor): Pool created by ``get_parse_executor``
+
+    Returns:
+        list[Item]: Betting items for all dates, in the order the dates were given
+    """
+    logger.info('Starting async scraping process for {count} dates', count=len(dates))
+    responses = await asyncio.gather(*[fetch(client, date) for date in dates])
+
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*[
+        loop.run_in_executor(executor, parse_page, response.content) for response in responses
+    ])
+
+    items = [item for date_items in results for item in date_items]
+    logger.info('Async scraping completed, {count} items extracted', count=len(items))
+    return items
+
+
+async def start_many(dates: list[str], max_connections: int = 64) -> list[Item]:
+    """Scrape several dates with a short-lived client and process pool.
+
+    Args:
+        dates (list[str]): Dates formatted as MM-DD-YYYY
+        max_connections (int): Maximum number of concurrent connections
+
+    Returns:
+        list[Item]: Betting items for all dates, in the order the dates were given
+    """
+    with get_parse_executor() as executor:
+        async with get_async_client(max_connections) as client:
+            return await scrape_dates(client, dates, executor)
@@ -0,0 +1,191 @@
+"""
+Builders that turn the text of an odds row into Item objects.
+
+This is the innermost loop of the scraper, so the module is written in
+Cython's pure Python mode: it runs as regular Python, and ``python build.py``
+compiles it into an extension module that is imported in its place.
+"""
+
+from functools import partial
+
+from app.models import Item
+
+# Translation table that turns line breaks into spaces and drops CR/tabs
+_WS_TO_SPACE_TABLE = str.maketrans({'\r': None, '\n': ' ', '\t': None})
+
+# Item factories with the fields that are constant for each line type already bound
+_moneyline_item = partial(Item, line_type='moneyline', spread=0, pitcher='')
+_draw_item = partial(_moneyline_item, side='draw', team='draw')
+_spread_item = partial(Item, line_type='spread', pitcher='')
+_under_over_item = partial(Item, line_type='over/under', team='total', pitcher='')
+
+
+def split_paren(text: str) -> tuple[str, str]:
+    """Split a ``value (price)`` cell into its value and parenthesized price.
+
+    Args:
+        text (str): Cell text such as ``-1.5 (+120)`` or ``O 8.5 (-110)``
+
+    Returns:
+        tuple[str, str]: Stripped text before the parenthesis and inside it
+    """
+    open_index = text.index('(')
+    close_index = text.find(')', open_index)
+    if close_index == -1:
+        close_index = len(text)
+    return text[:open_index].strip(), text[open_index + 1 : close_index].strip()
+
+
+def make_soccer_draw_moneyline(
+    cell_texts: list[str],
+    period: str,
+    time: str,
+    team1: str,
+    team2: str,
+    sport_league: str,
+) -> Item:
+    """Extract soccer draw moneyline odds.
+
+    Args:
+        cell_texts (list[str]): Text of each table cell with odds
+        period (str): Game period identifier
+        time (str): Game time or status in UTC
+        team1 (str): Name of team 1
+        team2 (str): Name of team 2
+        sport_league (str): Should be 'SOCCER'
+
+    Returns:
+        Item: Draw moneyline betting item
+    """
+    draw_text = cell_texts[1].translate(_WS_TO_SPACE_TABLE)
+    price = draw_text.split(' ')[1]
+    return _draw_item(
+        price=price,
+        sport_league=sport_league,
+        event_date_utc=time,
+        team1=team1,
+        team2=team2,
+        period=period,
+    )
+
+
+def make_moneyline(
+    cell_texts: list[str],
+    period: str,
+    time: str,
+    team1: str,
+    team2: str,
+    sport_league: str,
+) -> Item:
+    """Extract moneyline odds for a team.
+
+    Args:
+        cell_texts (list[str]): Text of each table cell with odds
+        period (str): Game period identifier
+        time (str): Game time or status in UTC
+        team1 (str): Name of team 1
+        team2 (str): Name of team 2
+        sport_league (str): Sport or league name
+
+    Returns:
+        Item: Moneyline betting item
+    """
+    side = team = cell_texts[0]
+    price = cell_texts[1]
+
+    return _moneyline_item(
+        side=side,
+        team=team,
+        price=price,
+        sport_league=sport_league,
+        event_date_utc=time,
+        team1=team1,
+        team2=team2,
+        period=period,
+    )
+
+
+def make_spread(
+    cell_texts: list[str],
+    period: str,
+    time: str,
+    team1: str,
+    team2: str,
+    sport_league: str,
+) -> Item:
+    """Extract spread betting odds for a team.
+
+    Args:
+        cell_texts (list[str]): Text of each table cell with odds
+        period (str): Game period identifier
+        time (str): Game time or status in UTC
+        team1 (str): Name of team 1
+        team2 (str): Name of team 2
+        sport_league (str): Sport or league name
+
+    Returns:
+        Item: Spread betting item
+    """
+    side = team = cell_texts[0]
+    spread_full_text = cell_texts[2]
+
+    if spread_full_text == 'N/A':
+        price = spread = 'N/A'
+    else:
+        spread, price = split_paren(spread_full_text)
+
+    return _spread_item(
+        side=side,
+        team=team,
+        price=price,
+        spread=spread,
+        sport_league=sport_league,
+        event_date_utc=time,
+        team1=team1,
+        team2=team2,
+        period=period,
+    )
+
+
+def make_under_over(
+    cell_texts: list[str],
+    period: str,
+    time: str,
+    team1: str,
+    team2: str,
+    sport_league: str,
+) -> Item:
+    """Extract over/under (totals) betting odds for a team.
+
+    Args:
+        cell_texts (list[str]): Text of each table cell with odds
+        period (str): Game period identifier
+        time (str): Game time or status in UTC
+        team1 (str): Name of team 1
+        team2 (str): Name of team 2
+        sport_league (str): Sport or league name
+
+    Returns:
+        Item: Over/under betting item
+    """
+    over_under_full_text = cell_texts[3].translate(_WS_TO_SPACE_TABLE)
+
+    if over_under_full_text == 'N/A':
+        price = spread = 'N/A'
+    else:
+        total, price = split_paren(over_under_full_text)
+        spread = total.split(' ')[1].strip()
+
+    side = over_under_full_text.split(' ')[0].strip()
+    side = 'over' if side == 'O' else 'under'
+
+    return _under_over_item(
+        side=side,
+        price=price,
+        spread=spread,
+        sport_league=sport_league,
+        event_date_utc=time,
+        team1=team1,
+        team2=team2,
+        period=period,
+    )
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Item:
     sport_league: str = ''
     event_date_utc: str = ''
@@ -13,4 +13,15 @@ class Item:
     price: str = ''
     side: str = ''
     team: str = ''
-    spread: float = 0.0
+    spread: float | str = 0.0  # Text such as '-1.5' or 'N/A' when read from the page
+
+    def __str__(self) -> str:
+        """Format the item like the repr of its ``asdict`` dict, without building the dict.
+
+        Returns:
+            str: Item fields as a dict literal
+        """
+        fields = ', '.join(
+            f'{name!r}: {getattr(self, name)!r}' for name in self.__dataclass_fields__
+        )
+        return '{' + fields + '}'
@@ -1,157 +1,408 @@
-import bs4
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import BinaryIO
+
+import lxml.html
 import requests
+from lxml import etree
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from app.item_builders import (
+    make_moneyline,
+    make_soccer_draw_moneyline,
+    make_spread,
+    make_under_over,
+)
 from app.models import Item
 from app.settings import get_logger
 from app.utils import convert_to_utc, get_current_date, get_random_user_agent
 
 logger = get_logger('scraper')
 
+PAGE_ENCODING = 'utf-8'
+# Period, team 1, team 2 and game time (plus draw odds for soccer) rows
+GAME_TABLE_ROWS = 4
+# Sport leagues whose game tables also carry draw odds
+DRAW_SPORT_LEAGUES = frozenset({'SOCCER'})
+
+# Retry policy for the odds page, shared with the batch scraper in app.async_scraper
+RETRY_STATUS_CODES = frozenset({429, *range(500, 600)})
+TOTAL_RETRIES = 3
+BACKOFF_FACTOR = 2
+
+# Comments and processing instructions are never read, so they are not kept in the tree
+_PARSER_OPTIONS = {'remove_comments': True, 'remove_pis': True}
+_HTML_PARSER = lxml.html.HTMLParser(encoding=PAGE_ENCODING, **_PARSER_OPTIONS)
+
+_XP_MAIN_TABLE = etree.XPath("//table[@id='odds-picks']")
+_XP_GAMES = etree.XPath(".//div[@class='col col-md']")
+_XP_GAME_TABLE = etree.XPath('.//table')
+# Text lookups evaluate to plain strings, so no intermediate elements are created
+_XP_LEAGUE_TEXT = etree.XPath('string(.//h2)', smart_strings=False)
+_XP_MUTED_TEXT = etree.XPath(
+    "string(.//span[contains(concat(' ', normalize-space(@class), ' '), ' text-muted ')])",
+    smart_strings=False,
+)
+_XP_TIME_TEXT = etree.XPath(
+    "string(.//span[@class='badge badge-light text-wrap text-left'])", smart_strings=False
+)
+
+# Translation table used to clean cell text in a single pass
+_WS_TABLE = str.maketrans('', '', '\r\n\t')
+
 
 class Scraper:
     """Web scraper for veri.bet that extracts betting odds information.
 
     This class handles fetching, parsing, and structuring betting data from veri.bet.
     It processes multiple sports and bet types, organizing them into structured Item objects.
+    This is the scraper the polling loop in ``main.py`` runs; ``app.async_scraper`` is
+    only meant for one-off batches of several dates.
 
     Attributes:
-        user_agent (str): Random user agent string for HTTP requests
+        user_agent (str): Random user agent string sent by this scraper's session
         index_url (str): URL template for fetching betting data by date
         session (requests.Session): HTTP session with retry configuration
         current_date (str): Current date formatted as MM-DD-YYYY
+        parse_workers (int): Number of processes used to parse sport leagues in parallel
     """
 
-    user_agent = get_random_user_agent()
     index_url = 'https://veri.bet/x-ajax-oddspicks?sDate={date}&showAll=yes'
 
-    def __init__(self):
-        """Initialize the scraper with a configured session and current date."""
+    def __init__(self, parse_workers: int = 1):
+        """Initialize the scraper with a configured session and current date.
+
+        Args:
+            parse_workers (int): Number of processes used to parse sport leagues.
+                With the default of 1, parsing stays in the current process.
+        """
         logger.debug('Initializing scraper')
+        # Each scraper picks its own user agent, so separate instances do not share one
+        self.user_agent = get_random_user_agent()
         self.session = self._get_requests_session()
-        self._configure_retry(status_to_force=[429, *range(500, 600)])
+        self._configure_retry(status_to_force=RETRY_STATUS_CODES)
         self.current_date = get_current_date()
-        logger.info(f'Scraper initialized with date: {self.current_date}')
+        self.parse_workers = parse_workers
+        self._parse_executor = None
+        logger.info('Scraper initialized with date: {date}', date=self.current_date)
 
     def start(self):
-        """Start the scraping process and return structured betting data.
+        """Scrape the current date and return structured betting data.
+
+        The date is read again on every call, so a long-lived scraper moves on to
+        the new day at midnight. The page is streamed and parsed while it downloads.
 
         Returns:
             list[Item]: List of betting items with all extracted data
         """
-        logger.info('Starting scraping process')
-        items = []
-        grouped_data = self._fetch_and_group_data()
+        self.current_date = get_current_date()
+        logger.info('Starting scraping process for {date}', date=self.current_date)
+        with self.fetch(self.current_date, stream=True) as response:
+            items = self.parse_stream(response)
+        logger.info('Scraping completed, {count} items extracted', count=len(items))
+        return items
 
-        logger.debug(f'Processing data for {len(grouped_data)} sport leagues')
-        for sport_league, rows in grouped_data.items():
-            logger.debug(f'Processing {len(rows)} rows for {sport_league}')
-            sport_items = self._process_sport_league_rows(sport_league, rows)
-            items.extend(sport_items)
+    def start_many(self, dates: list[str], max_workers: int = 8) -> list[Item]:
+        """Scrape several dates concurrently.
+
+        Requests are sent from a thread pool and each response is parsed on the
+        calling thread as soon as it arrives, overlapping parsing with the
+        remaining downloads.
+
+        Args:
+            dates (list[str]): Dates formatted as MM-DD-YYYY
+            max_workers (int): Maximum number of concurrent requests
 
-        logger.info(f'Scraping completed, {len(items)} items extracted')
+        Returns:
+            list[Item]: Betting items for all dates, in the order the dates were given
+        """
+        logger.info('Starting scraping process for {count} dates', count=len(dates))
+        items_by_date = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.fetch, date): date for date in dates}
+            for future in as_completed(futures):
+                items_by_date[futures[future]] = self.parse(future.result())
+
+        items = [item for date in dates for item in items_by_date[date]]
+        logger.info('Scraping completed, {count} items extracted', count=len(items))
         return items
 
-    def _fetch_and_group_data(self):
-        """Fetch betting data from the website and group it by sport/league.
+    def close(self):
+        """Shut down the parsing process pool, if any, and close the HTTP session."""
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown()
+            self._parse_executor = None
+        self.session.close()
+
+    def fetch(self, date: str, stream: bool = False) -> requests.Response:
+        """Fetch the betting data page for a given date.
+
+        Args:
+            date (str): Date formatted as MM-DD-YYYY
+            stream (bool): Return before the body is downloaded, for ``parse_stream``
 
         Returns:
-            dict: Data grouped by sport/league with corresponding HTML rows
+            requests.Response: HTTP response with the odds table
         """
-        logger.debug(f'Fetching data from: {self.index_url.format(date=self.current_date)}')
-        response = self.session.get(self.index_url.format(date=self.current_date))
+        url = self.index_url.format(date=date)
+        logger.debug('Fetching data from: {url}', url=url)
+        response = self.session.get(url, stream=stream)
+        # veri.bet serves UTF-8, so skip charset detection on any .text access
+        response.encoding = PAGE_ENCODING
 
         if response.status_code != 200:
-            logger.warning(f'Received non-200 status code: {response.status_code}')
+            logger.warning(
+                'Received non-200 status code: {status_code}', status_code=response.status_code
+            )
 
-        soup = self._get_soup(response)
-        main_table = soup.find('table', id='odds-picks')
+        return response
 
-        if not main_table:
-            logger.warning('Main table not found in the response')
-            return {}
+    def parse(self, response: requests.Response) -> list[Item]:
+        """Parse a fetched page into structured betting data.
 
-        rows_first_level = main_table.find_all('tr', recursive=False)
-        logger.debug(f'Found {len(rows_first_level)} first-level rows')
-        grouped_data = self._get_grouped_data(rows_first_level)
-        logger.debug(f'Data grouped into {len(grouped_data)} categories')
-        return grouped_data
+        Args:
+            response (requests.Response): HTTP response returned by fetch
 
-    def _process_sport_league_rows(
-        self, sport_league: str, rows: list[bs4.element.Tag]
-    ) -> list[Item]:
-        """Process all rows for a specific sport/league.
+        Returns:
+            list[Item]: List of betting items extracted from the page
+        """
+        return self.parse_content(response.content)
+
+    def parse_content(self, content: bytes) -> list[Item]:
+        """Parse a raw page body into structured betting data.
 
         Args:
-            sport_league (str): Name of the sport or league
-            rows (list[bs4.element.Tag]): List of HTML rows to process
+            content (bytes): Raw HTML body of the odds page
+
+        Returns:
+            list[Item]: List of betting items extracted from the page
+        """
+        return self._process_rows(self._get_main_rows(content))
+
+    def parse_stream(self, response: requests.Response) -> list[Item]:
+        """Parse a streamed page into structured betting data as it downloads.
+
+        Each first-level row of the odds table is processed as soon as it has been
+        received and is then released, so memory stays bounded by a single row.
+
+        Args:
+            response (requests.Response): Response returned by ``fetch(date, stream=True)``
+
+        Returns:
+            list[Item]: List of betting items extracted from the page
+        """
+        response.raw.decode_content = True
+        return self._process_rows(self._iter_main_rows(response.raw))
+
+    def _process_rows(self, rows: Iterable[etree._Element]) -> list[Item]:
+        """Process the first-level rows of the odds table in page order.
+
+        Args:
+            rows (Iterable[etree._Element]): First-level rows of the odds table
 
         Returns:
             list[Item]: Betting items extracted from the rows
         """
-        logger.debug(f'Processing rows for sport/league: {sport_league}')
+        league_rows = self._iter_league_rows(rows)
+        if self.parse_workers > 1:
+            return self._process_league_rows_in_pool(league_rows)
+        return self._process_league_rows(league_rows)
+
+    @staticmethod
+    def _process_league_rows(league_rows: Iterable[tuple[str, etree._Element]]) -> list[Item]:
+        """Process rows paired with their sport/league in the current process.
+
+        Args:
+            league_rows (Iterable[tuple[str, etree._Element]]): Rows paired with their
+                sport/league
+
+        Returns:
+            list[Item]: Betting items extracted from the rows, in page order
+        """
         items = []
-        for row in rows:
-            row_items = self._process_game_divs(sport_league, row)
-            items.extend(row_items)
-        logger.debug(f'Processed {len(items)} items for {sport_league}')
+        # Bind the per-row callables once instead of resolving them on every row
+        process_game_divs = Scraper._process_game_divs
+        extend_items = items.extend
+        for sport_league, row in league_rows:
+            extend_items(process_game_divs(sport_league, row))
         return items
 
-    def _process_game_divs(self, sport_league: str, row: bs4.element.Tag) -> list[Item]:
+    def _process_league_rows_in_pool(
+        self, league_rows: Iterable[tuple[str, etree._Element]]
+    ) -> list[Item]:
+        """Process each sport/league in a separate worker process.
+
+        Rows are serialized back to HTML as they are read so they can be sent to
+        the workers, which parse and process them independently.
+
+        Args:
+            league_rows (Iterable[tuple[str, etree._Element]]): Rows paired with their
+                sport/league
+
+        Returns:
+            list[Item]: Betting items for all sport leagues, in page order
+        """
+        rows_html_by_league = {}
+        for sport_league, row in league_rows:
+            row_html = etree.tostring(row, with_tail=False)
+            rows_html_by_league.setdefault(sport_league, []).append(row_html)
+        logger.debug(
+            'Processing {count} sport leagues in worker processes', count=len(rows_html_by_league)
+        )
+
+        items = []
+        executor = self._get_parse_executor()
+        for sport_items in executor.map(
+            parse_league, rows_html_by_league.keys(), rows_html_by_league.values()
+        ):
+            items.extend(sport_items)
+        return items
+
+    def _get_parse_executor(self) -> ProcessPoolExecutor:
+        """Return the process pool used to parse sport leagues, creating it on first use.
+
+        The pool is kept between scrapes and shut down by ``close``.
+
+        Returns:
+            ProcessPoolExecutor: Pool with ``parse_workers`` worker processes
+        """
+        if self._parse_executor is None:
+            self._parse_executor = ProcessPoolExecutor(max_workers=self.parse_workers)
+        return self._parse_executor
+
+    @staticmethod
+    def _get_main_rows(content: bytes) -> list[lxml.html.HtmlElement]:
+        """Parse the page body and return the first-level rows of the odds table.
+
+        Args:
+            content (bytes): Raw HTML body of the odds page
+
+        Returns:
+            list[lxml.html.HtmlElement]: First-level rows of the odds table
+        """
+        try:
+            document = Scraper._get_document(content)
+        except etree.ParserError:
+            logger.warning('Empty response body')
+            return []
+
+        main_tables = _XP_MAIN_TABLE(document)
+        if not main_tables:
+            logger.warning('Main table not found in the response')
+            return []
+
+        rows_first_level = main_tables[0].findall('tr')
+        logger.debug('Found {count} first-level rows', count=len(rows_first_level))
+        return rows_first_level
+
+    @staticmethod
+    def _iter_main_rows(source: BinaryIO) -> Iterator[etree._Element]:
+        """Incrementally parse a page and yield the first-level rows of the odds table.
+
+        Each row is yielded once its closing tag has been read. When the consumer
+        moves on, the row and the rows before it are removed from the tree.
+
+        Args:
+            source (BinaryIO): File-like object with the raw HTML body
+
+        Yields:
+            etree._Element: First-level rows of the odds table
+        """
+        rows_found = 0
+        context = etree.iterparse(
+            source,
+            events=('end',),
+            tag='tr',
+            html=True,
+            recover=True,
+            encoding=PAGE_ENCODING,
+            no_network=True,
+            **_PARSER_OPTIONS,
+        )
+        main_rows = (row for _, row in context if Scraper._is_main_row(row))
+        try:
+            for row in main_rows:
+                rows_found += 1
+                yield row
+                Scraper._release_row(row)
+        except etree.XMLSyntaxError as exc:
+            logger.warning('Failed to parse response body: {exc}', exc=exc)
+
+        logger.debug('Found {count} first-level rows', count=rows_found)
+        if not rows_found:
+            logger.warning('Main table not found in the response')
+
+    @staticmethod
+    def _process_game_divs(sport_league: str, row: lxml.html.HtmlElement) -> list[Item]:
         """Process game divisions within a row.
 
         Args:
             sport_league (str): Name of the sport or league
-            row (bs4.element.Tag): HTML row containing game divisions
+            row (lxml.html.HtmlElement): HTML row containing game divisions
 
         Returns:
             list[Item]: Betting items for all games in the row
         """
         items = []
-        div_games = row.find_all('div', class_='col col-md')
-        logger.debug(f'Found {len(div_games)} game divisions to process')
+        div_games = _XP_GAMES(row)
+        logger.debug('Found {count} game divisions to process', count=len(div_games))
 
+        # Whether games carry draw odds is a property of the league, so decide it once
+        has_draw = sport_league in DRAW_SPORT_LEAGUES
+        process_single_game = Scraper._process_single_game
+        extend_items = items.extend
         for div_game in div_games:
-            game_items = self._process_single_game(div_game, sport_league)
-            items.extend(game_items)
+            extend_items(process_single_game(div_game, sport_league, has_draw))
         return items
 
-    def _process_single_game(self, div_game: bs4.element.Tag, sport_league: str) -> list[Item]:
+    @staticmethod
+    def _process_single_game(
+        div_game: lxml.html.HtmlElement, sport_league: str, has_draw: bool = False
+    ) -> list[Item]:
         """Process a single game to extract all betting options.
 
         Extracts game information and processes odds for both teams.
-        For soccer, also processes the draw option.
+        For leagues with draws (soccer), also processes the draw option.
 
         Args:
-            div_game (bs4.element.Tag): HTML division containing a game
+            div_game (lxml.html.HtmlElement): HTML division containing a game
             sport_league (str): Name of the sport or league
+            has_draw (bool): Whether the game table also carries draw odds
 
         Returns:
             list[Item]: All betting items for this game
         """
         items = []
-        table_game = div_game.find('table')
-        if not table_game:
-            logger.warning(f'No table found in game division for {sport_league}')
+        tables_game = _XP_GAME_TABLE(div_game)
+        if not tables_game:
+            logger.warning(
+                'No table found in game division for {sport_league}', sport_league=sport_league
+            )
             return items
 
-        table_game_rows = table_game.find_all('tr', recursive=False)
-        if len(table_game_rows) < 3:
+        table_game_rows = tables_game[0].findall('tr')
+        if len(table_game_rows) < GAME_TABLE_ROWS:
             logger.warning(
-                f'Insufficient rows in game table for {sport_league}: {len(table_game_rows)}'
+                'Insufficient rows in game table for {sport_league}: {count}',
+                sport_league=sport_league,
+                count=len(table_game_rows),
             )
             return items
 
-        game_info = self._extract_game_info(table_game_rows)
+        period_row, team1_row, team2_row, info_row, *_ = table_game_rows
+        game_info = Scraper._extract_game_info(period_row, team1_row, team2_row, info_row)
         logger.debug(
-            f'Processing game: {game_info["team1"]} vs {game_info["team2"]} at {game_info["time"]}'
+            'Processing game: {team1} vs {team2} at {time}',
+            team1=game_info['team1'],
+            team2=game_info['team2'],
+            time=game_info['time'],
         )
 
         # Process regular team odds (for both teams)
-        for table_game_row in table_game_rows[1:3]:
-            team_items = self._process_team_odds(
-                table_game_row,
+        for team_row in (team1_row, team2_row):
+            team_items = Scraper._process_team_odds(
+                team_row,
                 game_info['period'],
                 game_info['time'],
                 game_info['team1'],
@@ -161,9 +412,9 @@ class Scraper:
             items.extend(team_items)
 
         # Process special case for soccer
-        if sport_league == 'SOCCER':
-            draw_item = self._process_soccer_draw_odds(
-                table_game_rows[3],
+        if has_draw:
+            draw_item = Scraper._process_soccer_draw_odds(
+                info_row,
                 game_info['period'],
                 game_info['time'],
                 game_info['team1'],
@@ -174,33 +425,37 @@ class Scraper:
 
         return items
 
-    def _extract_game_info(self, table_game_rows: list[bs4.element.Tag]) -> dict:
-        """Extract basic game information from table rows.
+    @staticmethod
+    def _extract_game_info(
+        period_row: lxml.html.HtmlElement,
+        team1_row: lxml.html.HtmlElement,
+        team2_row: lxml.html.HtmlElement,
+        info_row: lxml.html.HtmlElement,
+    ) -> dict:
+        """Extract basic game information from the game table rows.
 
         Args:
-            table_game_rows (list[bs4.element.Tag]): List of table rows with game info
+            period_row (lxml.html.HtmlElement): Row with the game period
+            team1_row (lxml.html.HtmlElement): Row with team 1 and its odds
+            team2_row (lxml.html.HtmlElement): Row with team 2 and its odds
+            info_row (lxml.html.HtmlElement): Row with the game time (and soccer draw odds)
 
         Returns:
             dict: Dictionary containing period, team names, and game time
         """
-        period = self._clean_text(table_game_rows[0].find('span', class_='text-muted').text)
-        team1 = table_game_rows[1].find('span', class_='text-muted').text.strip()
-        team2 = table_game_rows[2].find('span', class_='text-muted').text.strip()
-        time_raw = (
-            table_game_rows[3]
-            .find('span', class_='badge badge-light text-wrap text-left')
-            .text.strip()
-        )
-        time = self._clean_text(time_raw)
+        period = Scraper._clean_text(_XP_MUTED_TEXT(period_row))
+        team1 = _XP_MUTED_TEXT(team1_row).strip()
+        team2 = _XP_MUTED_TEXT(team2_row).strip()
+        time = Scraper._clean_text(_XP_TIME_TEXT(info_row))
 
         if time not in {'FINAL', 'IN PROGRESS'}:
             time = convert_to_utc(time)
 
         return {'period': period, 'team1': team1, 'team2': team2, 'time': time}
 
+    @staticmethod
     def _process_team_odds(
-        self,
-        table_game_row: bs4.element.Tag,
+        table_game_row: lxml.html.HtmlElement,
         period: str,
         time: str,
         team1: str,
@@ -212,7 +467,7 @@ class Scraper:
         Extracts moneyline, spread, and over/under odds for a single team.
 
         Args:
-            table_game_row (bs4.element.Tag): HTML row with team odds
+            table_game_row (lxml.html.HtmlElement): HTML row with team odds
             period (str): Game period identifier
             time (str): Game time or status in UTC
             team1 (str): Name of team 1
@@ -222,23 +477,16 @@ class Scraper:
         Returns:
             list[Item]: Three betting items (moneyline, spread, over/under)
         """
-        items = []
-        tds = table_game_row.find_all('td', recursive=False)
-
-        moneyline_item = self._get_moneyline_item(tds, period, time, team1, team2, sport_league)
-        items.append(moneyline_item)
-
-        spread_item = self._get_spread_item(tds, period, time, team1, team2, sport_league)
-        items.append(spread_item)
-
-        under_over_item = self._get_under_over_item(tds, period, time, team1, team2, sport_league)
-        items.append(under_over_item)
-
-        return items
+        texts = Scraper._get_cell_texts(table_game_row)
+        return [
+            make_moneyline(texts, period, time, team1, team2, sport_league),
+            make_spread(texts, period, time, team1, team2, sport_league),
+            make_under_over(texts, period, time, team1, team2, sport_league),
+        ]
 
+    @staticmethod
     def _process_soccer_draw_odds(
-        self,
-        table_game_row: bs4.element.Tag,
+        table_game_row: lxml.html.HtmlElement,
         period: str,
         time: str,
         team1: str,
@@ -250,7 +498,7 @@ class Scraper:
         Special case for soccer games where a draw is a possible outcome.
 
         Args:
-            table_game_row (bs4.element.Tag): HTML row with draw odds
+            table_game_row (lxml.html.HtmlElement): HTML row with draw odds
             period (str): Game period identifier
             time (str): Game time or status in UTC
             team1 (str): Name of team 1
@@ -260,223 +508,71 @@ class Scraper:
         Returns:
             Item: Draw betting item
         """
-        logger.debug(f'Processing soccer draw odds for {team1} vs {team2}')
-        tds = table_game_row.find_all('td', recursive=False)
-        return self._get_soccer_draw_moneyline_item(tds, period, time, team1, team2, sport_league)
-
-    @staticmethod
-    def _get_soccer_draw_moneyline_item(
-        table_game_row_tds: list[bs4.element.Tag],
-        period: str,
-        time: str,
-        team1: str,
-        team2: str,
-        sport_league: str,
-    ) -> Item:
-        """Extract soccer draw moneyline odds.
-
-        Args:
-            table_game_row_tds (list[bs4.element.Tag]): HTML table cells with odds
-            period (str): Game period identifier
-            time (str): Game time or status in UTC
-            team1 (str): Name of team 1
-            team2 (str): Name of team 2
-            sport_league (str): Should be 'SOCCER'
-
-        Returns:
-            Item: Draw moneyline betting item
-        """
-        side = team = 'draw'
-        line_type = 'moneyline'
-        spread = 0
-        money_line_column = table_game_row_tds[1]
-        draw_text = (
-            money_line_column.find('span', class_='text-muted')
-            .text.strip()
-            .replace('\r\n', ' ')
-            .replace('\t', '')
-        )
-        price = draw_text.split(' ')[1]
-        return Item(
-            side=side,
-            team=team,
-            line_type=line_type,
-            price=price,
-            spread=spread,
-            sport_league=sport_league,
-            event_date_utc=time,
-            team1=team1,
-            team2=team2,
-            period=period,
-            pitcher='',
-        )
+        logger.debug('Processing soccer draw odds for {team1} vs {team2}', team1=team1, team2=team2)
+        texts = Scraper._get_cell_texts(table_game_row)
+        return make_soccer_draw_moneyline(texts, period, time, team1, team2, sport_league)
 
     @staticmethod
-    def _get_moneyline_item(
-        table_game_row_tds: list[bs4.element.Tag],
-        period: str,
-        time: str,
-        team1: str,
-        team2: str,
-        sport_league: str,
-    ) -> Item:
-        """Extract moneyline odds for a team.
+    def _is_main_row(row: etree._Element) -> bool:
+        """Check whether a row belongs directly to the odds table.
 
         Args:
-            table_game_row_tds (list[bs4.element.Tag]): HTML table cells with odds
-            period (str): Game period identifier
-            time (str): Game time or status in UTC
-            team1 (str): Name of team 1
-            team2 (str): Name of team 2
-            sport_league (str): Sport or league name
+            row (etree._Element): Table row
 
         Returns:
-            Item: Moneyline betting item
+            bool: True for first-level rows of the odds table
         """
-        side = team = table_game_row_tds[0].find('span', class_='text-muted').text.strip()
-        line_type = 'moneyline'
-        money_line_column = table_game_row_tds[1]
-        price = money_line_column.find('span', class_='text-muted').text.strip()
-        spread = 0
-
-        return Item(
-            side=side,
-            team=team,
-            line_type=line_type,
-            price=price,
-            spread=spread,
-            sport_league=sport_league,
-            event_date_utc=time,
-            team1=team1,
-            team2=team2,
-            period=period,
-            pitcher='',
-        )
+        table = row.getparent()
+        return table is not None and table.tag == 'table' and table.get('id') == 'odds-picks'
 
     @staticmethod
-    def _get_spread_item(
-        table_game_row_tds: list[bs4.element.Tag],
-        period: str,
-        time: str,
-        team1: str,
-        team2: str,
-        sport_league: str,
-    ) -> Item:
-        """Extract spread betting odds for a team.
+    def _release_row(row: etree._Element):
+        """Free a processed row and every row before it from the parsed tree.
 
         Args:
-            table_game_row_tds (list[bs4.element.Tag]): HTML table cells with odds
-            period (str): Game period identifier
-            time (str): Game time or status in UTC
-            team1 (str): Name of team 1
-            team2 (str): Name of team 2
-            sport_league (str): Sport or league name
-
-        Returns:
-            Item: Spread betting item
+            row (etree._Element): First-level row that has been processed
         """
-        side = team = table_game_row_tds[0].find('span', class_='text-muted').text.strip()
-        line_type = 'spread'
-        spread_column = table_game_row_tds[2]
-        spread_full_text = spread_column.find('span', class_='text-muted').text.strip()
-
-        if spread_full_text == 'N/A':
-            price = spread = 'N/A'
-        else:
-            price = spread_full_text.split('(')[1].split(')')[0].strip()
-            spread = spread_full_text.split('(')[0].strip()
-
-        return Item(
-            side=side,
-            team=team,
-            line_type=line_type,
-            price=price,
-            spread=spread,
-            sport_league=sport_league,
-            event_date_utc=time,
-            team1=team1,
-            team2=team2,
-            period=period,
-            pitcher='',
-        )
+        table = row.getparent()
+        row.clear(keep_tail=True)
+        while row.getprevious() is not None:
+            del table[0]
 
     @staticmethod
-    def _get_under_over_item(
-        table_game_row_tds: list[bs4.element.Tag],
-        period: str,
-        time: str,
-        team1: str,
-        team2: str,
-        sport_league: str,
-    ) -> Item:
-        """Extract over/under (totals) betting odds for a team.
+    def _iter_league_rows(
+        rows: Iterable[etree._Element],
+    ) -> Iterator[tuple[str, etree._Element]]:
+        """Pair each game row with the sport/league header that precedes it.
 
         Args:
-            table_game_row_tds (list[bs4.element.Tag]): HTML table cells with odds
-            period (str): Game period identifier
-            time (str): Game time or status in UTC
-            team1 (str): Name of team 1
-            team2 (str): Name of team 2
-            sport_league (str): Sport or league name
+            rows (Iterable[etree._Element]): First-level rows of the odds table
 
-        Returns:
-            Item: Over/under betting item
+        Yields:
+            tuple[str, etree._Element]: Sport/league name and a row of its games
         """
-        line_type = 'over/under'
-        over_under_column = table_game_row_tds[3]
-        over_under_full_text = (
-            over_under_column.find('span', class_='text-muted')
-            .text.strip()
-            .replace('\r\n', ' ')
-            .replace('\t', '')
-        )
+        current_group = None
 
-        if over_under_full_text == 'N/A':
-            price = spread = 'N/A'
-        else:
-            price = over_under_full_text.split('(')[1].split(')')[0].strip()
-            spread = over_under_full_text.split('(')[0].strip().split(' ')[1].strip()
-
-        team = 'total'
-        side = over_under_full_text.split(' ')[0].strip()
-        side = 'over' if side == 'O' else 'under'
-
-        return Item(
-            side=side,
-            team=team,
-            line_type=line_type,
-            price=price,
-            spread=spread,
-            sport_league=sport_league,
-            event_date_utc=time,
-            team1=team1,
-            team2=team2,
-            period=period,
-            pitcher='',
-        )
+        for row in rows:
+            sport_league = _XP_LEAGUE_TEXT(row).strip()
+            if sport_league:
+                current_group = sport_league
+                logger.debug('Found sport/league: {sport_league}', sport_league=current_group)
+                continue
+            if current_group is None:
+                logger.warning('Skipping row found before any sport/league header')
+                continue
+            yield current_group, row
 
     @staticmethod
-    def _get_grouped_data(rows: list[bs4.element.Tag]) -> dict:
-        """Group HTML rows by sport/league.
+    def _get_cell_texts(table_game_row: lxml.html.HtmlElement) -> list[str]:
+        """Read the muted text of every cell in a row in a single pass.
 
         Args:
-            rows (list[bs4.element.Tag]): List of HTML rows to group
+            table_game_row (lxml.html.HtmlElement): HTML row with odds cells
 
         Returns:
-            dict: Dictionary with sport/league names as keys and rows as values
+            list[str]: Stripped text of the first ``text-muted`` span of each cell
         """
-        grouped_data = {}
-        current_group = None
-
-        for row in rows:
-            sport_league = row.find('h2')
-            if sport_league:
-                current_group = sport_league.text.strip()
-                grouped_data[current_group] = []
-                continue
-            grouped_data[current_group].append(row)
-
-        return grouped_data
+        return [_XP_MUTED_TEXT(td).strip() for td in table_game_row.findall('td')]
 
     @staticmethod
     def _clean_text(text: str) -> str:
@@ -488,7 +584,7 @@ class Scraper:
         Returns:
             str: Cleaned text
         """
-        return text.strip().replace('\r', '').replace('\n', '').replace('\t', '')
+        return text.translate(_WS_TABLE).strip()
 
     def _get_requests_session(self) -> requests.Session:
         """Create and configure a requests session with custom user agent.
@@ -502,33 +598,73 @@ class Scraper:
         return session
 
     @staticmethod
-    def _get_soup(response: requests.Response) -> bs4.BeautifulSoup:
-        """Convert HTTP response to BeautifulSoup object.
+    def _get_document(content: bytes) -> lxml.html.HtmlElement:
+        """Parse a raw HTML body into an lxml document.
+
+        The bytes are decoded by libxml2 as UTF-8, so no charset detection
+        runs in Python.
 
         Args:
-            response (requests.Response): HTTP response
+            content (bytes): Raw HTML body
 
         Returns:
-            bs4.BeautifulSoup: Parsed HTML
+            lxml.html.HtmlElement: Root element of the parsed HTML
         """
-        return bs4.BeautifulSoup(response.text, 'html.parser')
+        return lxml.html.document_fromstring(content, parser=_HTML_PARSER)
 
-    def _configure_retry(self, status_to_force: list = [], total_retries: int = 3):
+    def _configure_retry(
+        self, status_to_force: Collection[int] = (), total_retries: int = TOTAL_RETRIES
+    ):
         """Configure automatic retry for HTTP requests.
 
         Sets up retry mechanism for handling transient HTTP errors.
 
         Args:
-            status_to_force (list): HTTP status codes that should trigger a retry
+            status_to_force (Collection[int]): HTTP status codes that should trigger a retry
             total_retries (int): Maximum number of retry attempts
         """
-        logger.debug(f'Configuring retry strategy with {total_retries} retries')
+        logger.debug(
+            'Configuring retry strategy with {total_retries} retries', total_retries=total_retries
+        )
         retry_strategy = Retry(
             total=total_retries,
-            backoff_factor=2,
+            backoff_factor=BACKOFF_FACTOR,
             status_forcelist=status_to_force,
             allowed_methods=['HEAD', 'GET', 'OPTIONS', 'POST'],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep enough connections alive for concurrent fetches to reuse them
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=4, pool_maxsize=32)
         self.session.mount('https://', adapter)
         self.session.mount('http://', adapter)
+
+
+def parse_page(content: bytes) -> list[Item]:
+    """Parse a full page body, without the HTTP session of a Scraper.
+
+    Used by worker processes, which only need the parsing helpers.
+
+    Args:
+        content (bytes): Raw HTML body of the odds page
+
+    Returns:
+        list[Item]: List of betting items extracted from the page
+    """
+    return Scraper._process_league_rows(Scraper._iter_league_rows(Scraper._get_main_rows(content)))
+
+
+def parse_league(sport_league: str, rows_html: list[bytes]) -> list[Item]:
+    """Parse the serialized rows of one sport/league inside a worker process.
+
+    Args:
+        sport_league (str): Name of the sport or league
+        rows_html (list[bytes]): HTML of each row belonging to the sport/league
+
+    Returns:
+        list[Item]: Betting items extracted from the rows
+    """
+    rows = (lxml.html.fragment_fromstring(row_html) for row_html in rows_html)
+    items = Scraper._process_league_rows((sport_league, row) for row in rows)
+    logger.debug(
+        'Processed {count} items for {sport_league}', count=len(items), sport_league=sport_league
+    )
+    return items
@@ -1,36 +1,89 @@
-from datetime import datetime
+import random
+import re
+import time
+from datetime import date, datetime, timedelta
+from functools import cache, lru_cache
 from zoneinfo import ZoneInfo
 
 import ua_generator
 
+_TZ_ET = ZoneInfo('America/New_York')  # ET = Eastern Time
+_TZ_UTC = ZoneInfo('UTC')
+
+# 'H:MM' as accepted by strptime's '%I:%M', limited to ASCII digits
+_TIME_PATTERN = re.compile(r'(1[0-2]|0?[1-9]):([0-5]?[0-9])')
+
+# Number of user agents generated on first use to pick from
+USER_AGENT_POOL_SIZE = 64
+
+# Formatted current date and the timestamp of the local midnight it expires at
+_DATE_CACHE = [0.0, '']
+
+
+@cache
+def _get_user_agent_pool() -> tuple[str, ...]:
+    """Generate the desktop user agents to pick from, once per process.
+
+    Returns:
+        tuple[str, ...]: User agent strings
+    """
+    return tuple(
+        ua_generator.generate(
+            device=['desktop'],
+            platform=['windows', 'linux', 'macos'],
+            browser=['chrome', 'firefox', 'edge', 'safari'],
+        ).text
+        for _ in range(USER_AGENT_POOL_SIZE)
+    )
+
 
 def get_random_user_agent() -> str:
-    return ua_generator.generate(
-        device=['desktop'],
-        platform=['windows', 'linux', 'macos'],
-        browser=['chrome', 'firefox', 'edge', 'safari'],
-    ).text
+    """Pick a desktop user agent from the pool.
+
+    Returns:
+        str: User agent string
+    """
+    return random.choice(_get_user_agent_pool())
 
 
 def convert_to_utc(time_str: str) -> str:
+    # Keyed on today's date too, so cached conversions do not leak into the next day
+    return _convert_cached(time_str, datetime.now().date().toordinal())
+
+
+@lru_cache(maxsize=512)
+def _convert_cached(time_str: str, date_ordinal: int) -> str:
     hour_eastern_time, period = time_str.split(' ')[:2]
-    tz_et = ZoneInfo('America/New_York')  # ET = Eastern Time
-
-    date_eastern_time = datetime.strptime(f'{hour_eastern_time} {period}', '%I:%M %p')
-    date_eastern_time = date_eastern_time.replace(
-        year=datetime.now().year,
-        month=datetime.now().month,
-        day=datetime.now().day,
-        tzinfo=tz_et,
-    )
-    date_utc = date_eastern_time.astimezone(ZoneInfo('UTC'))
-    return date_utc.isoformat().replace('+00:00', '+00:00')
+    today = date.fromordinal(date_ordinal)
+
+    # Input is always 'H:MM AM|PM', so parse it by hand instead of through strptime
+    match = _TIME_PATTERN.fullmatch(hour_eastern_time)
+    period = period.upper()
+    if match is None or period not in {'AM', 'PM'}:
+        raise ValueError(f"time data {time_str!r} does not match format '%I:%M %p'")
+    hour = int(match[1]) % 12 + (12 if period == 'PM' else 0)
+    minute = int(match[2])
+
+    date_eastern_time = datetime(today.year, today.month, today.day, hour, minute, tzinfo=_TZ_ET)
+    # astimezone only runs once per distinct time and day, since _convert_cached
+    # memoizes the result; it also stays correct on DST change days
+    date_utc = date_eastern_time.astimezone(_TZ_UTC)
+    return date_utc.isoformat()
 
 
 def get_current_date() -> str:
     """Get the current date formatted as MM-DD-YYYY.
 
+    The string is cached until the next local midnight.
+
     Returns:
         str: Formatted current date
     """
-    return datetime.now().strftime('%m-%d-%Y')
+    timestamp = time.time()
+    if timestamp >= _DATE_CACHE[0]:
+        today = date.today()
+        _DATE_CACHE[1] = f'{today.month:02d}-{today.day:02d}-{today.year}'
+        _DATE_CACHE[0] = datetime.combine(
+            today + timedelta(days=1), datetime.min.time()
+        ).timestamp()
+    return _DATE_CACHE[1]
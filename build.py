@@ -0,0 +1,23 @@
+"""
+Compile the hot item-building module with Cython.
+
+``app/item_builders.py`` is plain Python written in Cython's pure Python
+mode. Running this script builds it into an extension module next to the
+source, which Python then imports instead of the ``.py`` file. Without the
+compiled module the application keeps working on the pure Python version.
+
+Usage:
+    poetry run task build
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+CYTHON_MODULES = [Extension('app.item_builders', ['app/item_builders.py'])]
+
+if __name__ == '__main__':
+    setup(
+        name='app',
+        ext_modules=cythonize(CYTHON_MODULES, language_level=3),
+        script_args=['build_ext', '--inplace'],
+    )
@@ -1,85 +1,151 @@
+import asyncio
+import sys
 import time
-from dataclasses import asdict
+
+import requests
+import urllib3
 
 from app.scraper import Scraper
-from app.settings import get_logger
+from app.settings import SCRAPER_INTERVAL_SECONDS, get_logger
 
 # Get logger for main module
 logger = get_logger('main')
 
 
-def main():
+async def main():
     """
     Main entry point for the odds scraper application.
 
-    This function initializes the scraper and runs it in a continuous loop,
+    This function runs the scraper in a continuous loop on an asyncio event loop,
     comparing current data with previous data to detect and report changes.
+    A new cycle starts every ``SCRAPER_INTERVAL_SECONDS`` and scrapes the current date.
+    Each cycle runs ``Scraper.start`` in a worker thread, so the event loop stays free
+    while the page downloads and the wait between cycles yields to it. A cycle whose
+    request fails is skipped, so its items are not reported as removed.
     """
     logger.info('Initializing odds scraper application')
-    scraper = Scraper()
     previous_items = []
+    previous_set = frozenset()
+    previous_fingerprint = get_items_fingerprint(previous_items)
+
+    scraper = Scraper()
+    try:
+        while True:
+            cycle_start = time.monotonic()
+            logger.info('Starting new scraping cycle')
+            logger.debug(f'Previous cycle had {len(previous_items)} items')
+
+            # The streamed body is read straight from urllib3, so its errors are not wrapped
+            try:
+                current_items = await asyncio.to_thread(scraper.start)
+            except (requests.RequestException, urllib3.exceptions.HTTPError) as exc:
+                logger.error(f'Scraping failed, skipping this cycle: {exc}')
+                await wait_for_next_cycle(cycle_start)
+                continue
+            logger.debug(f'Current cycle found {len(current_items)} items')
+
+            # Most cycles see the same odds again, so skip the diff when nothing changed
+            current_fingerprint = get_items_fingerprint(current_items)
+            if current_fingerprint == previous_fingerprint:
+                new_or_changed, removed_items = [], []
+            else:
+                # Hash the items once, the set is reused as the previous set next cycle
+                current_set = frozenset(current_items)
+                new_or_changed = find_new_or_changed_items(
+                    current_items, previous_items, previous_set
+                )
+                removed_items = find_removed_items(current_items, previous_items, current_set)
+                previous_set = current_set
+
+            logger.info(
+                f'Found {len(new_or_changed)} new/changed items '
+                f'and {len(removed_items)} removed items'
+            )
+            report_changes(new_or_changed, removed_items)
 
-    while True:
-        logger.info('Starting new scraping cycle')
-        logger.debug(f'Previous cycle had {len(previous_items)} items')
+            previous_items = current_items
+            previous_fingerprint = current_fingerprint
+            await wait_for_next_cycle(cycle_start)
+    finally:
+        scraper.close()
 
-        current_items = scraper.start()
-        logger.debug(f'Current cycle found {len(current_items)} items')
 
-        new_or_changed = find_new_or_changed_items(current_items, previous_items)
-        removed_items = find_removed_items(current_items, previous_items)
+async def wait_for_next_cycle(cycle_start):
+    """Sleep for what is left of the interval, so cycles start at a steady pace.
 
-        logger.info(
-            f'Found {len(new_or_changed)} new/changed items and {len(removed_items)} removed items'
-        )
-        report_changes(new_or_changed, removed_items)
+    Args:
+        cycle_start (float): ``time.monotonic()`` value taken when the cycle started
+    """
+    elapsed = time.monotonic() - cycle_start
+    logger.debug('Waiting for next cycle')
+    await asyncio.sleep(max(0.0, SCRAPER_INTERVAL_SECONDS - elapsed))
+
+
+def get_items_fingerprint(items):
+    """Compute a cheap fingerprint to tell whether two item lists are the same.
+
+    Args:
+        items (list): List of scraped items
 
-        previous_items = current_items.copy()
-        logger.debug('Waiting for next cycle')
-        time.sleep(10)
+    Returns:
+        tuple: Number of items and the hash of all items in order
+    """
+    return len(items), hash(tuple(items))
 
 
-def find_new_or_changed_items(current_items, previous_items):
+def find_new_or_changed_items(current_items, previous_items, previous_set=None):
     """Find items that are new or have changed compared to previous items.
 
     Args:
         current_items (list): Current list of scraped items
         previous_items (list): Previous list of scraped items
+        previous_set (frozenset, optional): Set of the previous items, built when not given
 
     Returns:
         list: Items that are new or have changed
     """
     logger.debug('Looking for new or changed items')
+    if not previous_items:
+        return list(current_items)
+
+    if previous_set is None:
+        previous_set = frozenset(previous_items)
     new_or_changed = []
     for current in current_items:
-        is_new_or_changed = True
-        for prev in previous_items:
-            if current == prev:
-                is_new_or_changed = False
-                break
-        if is_new_or_changed:
+        if current not in previous_set:
             logger.debug(
-                f'Found new/changed item: {current.team1} vs {current.team2} - {current.line_type}'
+                'Found new/changed item: {item.team1} vs {item.team2} - {item.line_type}',
+                item=current,
             )
             new_or_changed.append(current)
     return new_or_changed
 
 
-def find_removed_items(current_items, previous_items):
+def find_removed_items(current_items, previous_items, current_set=None):
     """Find items that were present before but are now removed.
 
     Args:
         current_items (list): Current list of scraped items
         previous_items (list): Previous list of scraped items
+        current_set (frozenset, optional): Set of the current items, built when not given
 
     Returns:
         list: Items that have been removed
     """
     logger.debug('Looking for removed items')
+    if not previous_items:
+        return []
+    if not current_items:
+        return list(previous_items)
+
+    if current_set is None:
+        current_set = frozenset(current_items)
     removed_items = []
     for prev in previous_items:
-        if prev not in current_items:
-            logger.debug(f'Found removed item: {prev.team1} vs {prev.team2} - {prev.line_type}')
+        if prev not in current_set:
+            logger.debug(
+                'Found removed item: {item.team1} vs {item.team2} - {item.line_type}', item=prev
+            )
             removed_items.append(prev)
     return removed_items
 
@@ -98,16 +164,23 @@ def report_changes(new_or_changed, removed_items):
         # Print new or changed items
         if new_or_changed:
             logger.info(f'Reporting {len(new_or_changed)} new or changed items')
-            for item in new_or_changed:
-                print(asdict(item))
+            write_items(new_or_changed)
 
         if removed_items:
             logger.info(f'Reporting {len(removed_items)} removed items')
             logger.info('REMOVED ITEMS')
-            for item in removed_items:
-                print(asdict(item))
+            write_items(removed_items)
+
+
+def write_items(items):
+    """Write items to stdout, one per line, in a single call.
+
+    Args:
+        items (list): Items to write
+    """
+    sys.stdout.write(''.join([f'{item}\n' for item in items]))
 
 
 if __name__ == '__main__':
     logger.info('Application startup')
-    main()
+    asyncio.run(main())
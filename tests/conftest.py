@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import pytest
+from loguru import logger
+
+FIXTURE_PAGE = Path(__file__).parent / 'fixtures' / 'odds_page.html'
+
+
+@pytest.fixture(autouse=True)
+def log_to_tmp_path(tmp_path):
+    """Send log records to a file under ``tmp_path`` instead of the repo's ``logs/``."""
+    logger.remove()
+    logger.add(tmp_path / 'app.log', level='DEBUG')
+    yield
+    logger.remove()
+
+
+@pytest.fixture
+def content() -> bytes:
+    return FIXTURE_PAGE.read_bytes()
@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app import async_scraper
+from app.async_scraper import _get_backoff_time, fetch, scrape_date
+from app.scraper import Scraper, parse_page
+
+
+def mock_client(statuses, content=b''):
+    """Build a client whose responses have the given status codes, one per request."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        status_code = statuses[min(len(requests), len(statuses)) - 1]
+        return httpx.Response(status_code, content=content)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(async_scraper, 'BACKOFF_FACTOR', 0)
+
+
+def test_fetch_retries_retryable_statuses():
+    client, requests = mock_client([503, 429, 200])
+
+    response = asyncio.run(fetch(client, '03-08-2025'))
+
+    assert response.status_code == httpx.codes.OK
+    assert len(requests) == 3
+    assert str(requests[0].url) == Scraper.index_url.format(date='03-08-2025')
+
+
+def test_fetch_raises_after_the_last_retry():
+    client, requests = mock_client([503])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(fetch(client, '03-08-2025'))
+
+    assert len(requests) == async_scraper.TOTAL_RETRIES + 1
+
+
+def test_fetch_does_not_retry_other_statuses():
+    client, requests = mock_client([404])
+
+    response = asyncio.run(fetch(client, '03-08-2025'))
+
+    assert response.status_code == httpx.codes.NOT_FOUND
+    assert len(requests) == 1
+
+
+def test_scrape_date_parses_the_page(content):
+    client, _ = mock_client([502, 200], content)
+
+    assert asyncio.run(scrape_date(client, '03-08-2025')) == parse_page(content)
+
+
+def test_backoff_time_follows_retry_after_header(monkeypatch):
+    monkeypatch.setattr(async_scraper, 'BACKOFF_FACTOR', 2)
+    response = httpx.Response(503)
+    throttled = httpx.Response(429, headers={'Retry-After': '7'})
+
+    assert [_get_backoff_time(response, retry) for retry in (1, 2, 3)] == [0.0, 4.0, 8.0]
+    assert _get_backoff_time(throttled, 1) == 7.0
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+import requests
+import urllib3
+
+import main
+from app.models import Item
+
+ITEMS = [
+    Item(sport_league='NBA', team1='Lakers', team2='Celtics', line_type='moneyline', price='+120'),
+    Item(sport_league='NBA', team1='Lakers', team2='Celtics', line_type='spread', price='-110'),
+    Item(sport_league='NBA', team1='Lakers', team2='Celtics', line_type='over/under', price='-105'),
+]
+
+
+class StopLoop(Exception):
+    """Raised by ScriptedScraper once every scripted cycle has run."""
+
+
+class ScriptedScraper:
+    """Stand-in for Scraper that returns, or raises, one scripted result per cycle."""
+
+    def __init__(self, cycles):
+        self.cycles = iter(cycles)
+
+    def start(self):
+        result = next(self.cycles, StopLoop())
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def close(self):
+        pass
+
+
+def run_main(monkeypatch, cycles):
+    """Run main() over the scripted cycles and return what each cycle reported."""
+    reports = []
+    monkeypatch.setattr(main, 'Scraper', lambda: ScriptedScraper(cycles))
+    monkeypatch.setattr(main, 'SCRAPER_INTERVAL_SECONDS', 0)
+    monkeypatch.setattr(main, 'report_changes', lambda *changes: reports.append(changes))
+    with pytest.raises(StopLoop):
+        asyncio.run(main.main())
+    return reports
+
+
+def spy(monkeypatch, name):
+    """Record the arguments of every call to a main module function."""
+    calls = []
+    function = getattr(main, name)
+
+    def wrapper(*args):
+        calls.append(args)
+        return function(*args)
+
+    monkeypatch.setattr(main, name, wrapper)
+    return calls
+
+
+def test_main_skips_diff_when_items_repeat(monkeypatch):
+    calls = spy(monkeypatch, 'find_new_or_changed_items')
+
+    reports = run_main(monkeypatch, [ITEMS, list(ITEMS), ITEMS[:1]])
+
+    assert reports == [(ITEMS, []), ([], []), ([], ITEMS[1:])]
+    # The repeated second cycle never reaches the diff
+    assert len(calls) == 2
+
+
+def test_main_carries_previous_set_forward(monkeypatch):
+    new_calls = spy(monkeypatch, 'find_new_or_changed_items')
+    removed_calls = spy(monkeypatch, 'find_removed_items')
+
+    reports = run_main(monkeypatch, [ITEMS[:2], ITEMS, ITEMS[1:]])
+
+    assert reports == [(ITEMS[:2], []), (ITEMS[2:], []), ([], ITEMS[:1])]
+    # Each cycle's set of current items is reused, not rebuilt, as the next previous set
+    assert new_calls[1][2] is removed_calls[0][2]
+    assert new_calls[2][2] is removed_calls[1][2]
+    assert new_calls[2][2] == frozenset(ITEMS)
+
+
+def test_main_skips_failed_cycles(monkeypatch):
+    cycles = [
+        ITEMS,
+        requests.ConnectionError('connection refused'),
+        urllib3.exceptions.ProtocolError('connection broken'),
+        ITEMS,
+    ]
+
+    reports = run_main(monkeypatch, cycles)
+
+    # Failed cycles report nothing, so their items are not reported as removed
+    assert reports == [(ITEMS, []), ([], [])]
+
+
+def test_find_new_or_changed_items_on_first_cycle():
+    new_or_changed = main.find_new_or_changed_items(ITEMS, [])
+
+    assert new_or_changed == ITEMS
+    assert new_or_changed is not ITEMS
+
+
+def test_find_removed_items_on_first_cycle():
+    assert main.find_removed_items(ITEMS, []) == []
+
+
+def test_find_removed_items_on_empty_cycle():
+    removed_items = main.find_removed_items([], ITEMS)
+
+    assert removed_items == ITEMS
+    assert removed_items is not ITEMS
+
+
+def test_diff_finds_changes_between_cycles():
+    current_items = [ITEMS[0], Item(sport_league='NBA', team1='Lakers', price='+100')]
+
+    assert main.find_new_or_changed_items(current_items, ITEMS) == current_items[1:]
+    assert main.find_removed_items(current_items, ITEMS) == ITEMS[1:]
@@ -0,0 +1,10 @@
+from dataclasses import asdict
+
+from app.models import Item
+
+
+def test_str_matches_asdict():
+    item = Item(sport_league='NBA', team1="Lakers 'LA'", price='+120', spread='N/A')
+
+    assert str(item) == str(asdict(item))
+    assert str(Item()) == str(asdict(Item()))
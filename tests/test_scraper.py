@@ -0,0 +1,95 @@
+import pytest
+import requests
+
+from app.scraper import Scraper, parse_page
+
+
+class ChunkedRaw:
+    """Minimal stand-in for ``response.raw`` that returns the body in small chunks.
+
+    Small reads make the streaming parser see rows cut across read boundaries.
+    """
+
+    def __init__(self, content: bytes, chunk_size: int):
+        self.content = content
+        self.chunk_size = chunk_size
+        self.position = 0
+        self.decode_content = False
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = len(self.content)
+        size = min(size, self.chunk_size)
+        chunk = self.content[self.position : self.position + size]
+        self.position += len(chunk)
+        return chunk
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def scraper():
+    scraper = Scraper()
+    yield scraper
+    scraper.close()
+
+
+def streamed_response(content: bytes, chunk_size: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = ChunkedRaw(content, chunk_size)
+    return response
+
+
+def test_parse_content_extracts_every_bet(scraper, content):
+    items = scraper.parse_content(content)
+
+    # 4 games with 6 bets each, plus the draw of the soccer game
+    assert len(items) == 25
+    assert [item.sport_league for item in items].count('SOCCER') == 7
+    draw = items[-1]
+    assert (draw.side, draw.team, draw.price) == ('draw', 'draw', '+230')
+
+
+@pytest.mark.parametrize('chunk_size', [64, 1024, 1 << 16])
+def test_parse_stream_matches_parse_content(scraper, content, chunk_size):
+    expected = scraper.parse_content(content)
+
+    items = scraper.parse_stream(streamed_response(content, chunk_size))
+
+    assert items == expected
+
+
+def test_parse_page_matches_parse_content(scraper, content):
+    assert parse_page(content) == scraper.parse_content(content)
+
+
+def test_parse_stream_without_main_table(scraper):
+    response = streamed_response(b'<html><body><p>Maintenance</p></body></html>', 64)
+
+    assert scraper.parse_stream(response) == []
+
+
+def test_start_reads_current_date_on_every_call(scraper, content, monkeypatch):
+    dates = iter(['03-08-2025', '03-09-2025'])
+    fetched = []
+
+    def fetch(date, stream=False):
+        fetched.append(date)
+        return streamed_response(content, 1 << 16)
+
+    monkeypatch.setattr('app.scraper.get_current_date', lambda: next(dates))
+    monkeypatch.setattr(scraper, 'fetch', fetch)
+
+    assert scraper.start() == scraper.start()
+    # A long-lived scraper moves on to the new day
+    assert fetched == ['03-08-2025', '03-09-2025']
+
+
+def test_parse_workers_match_parse_content(scraper, content):
+    pool_scraper = Scraper(parse_workers=2)
+    try:
+        assert pool_scraper.parse_content(content) == scraper.parse_content(content)
+    finally:
+        pool_scraper.close()
@@ -0,0 +1,98 @@
+from datetime import date, datetime
+from itertools import product
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app import utils
+from app.utils import _convert_cached, get_current_date
+
+TZ_ET = ZoneInfo('America/New_York')
+TZ_UTC = ZoneInfo('UTC')
+
+HOURS = ['0', '00', '1', '01', '7', '07', '9', '10', '12', '13', '012', '+7', '1_0', ' 7']
+MINUTES = ['0', '00', '5', '05', '30', '59', '60', '030', '+5', '-5', '3 ', '']
+PERIODS = ['AM', 'PM', 'am', 'Pm', 'XM', '']
+# Inputs that int() accepts but the '%I:%M %p' format does not
+MALFORMED_TIMES = ['+7:30 PM', '7:030 PM', '1_0:30 PM', '7:+5 PM', '7:30', '7 PM', '7:30PM']
+
+
+def strptime_to_utc(time_str: str, day: date) -> str:
+    """Convert a game time the way convert_to_utc did before it parsed times by hand."""
+    hour_eastern_time, period = time_str.split(' ')[:2]
+    parsed = datetime.strptime(f'{hour_eastern_time} {period}', '%I:%M %p')
+    return datetime.combine(day, parsed.time(), tzinfo=TZ_ET).astimezone(TZ_UTC).isoformat()
+
+
+def convert_or_error(convert, *args) -> str:
+    try:
+        return convert(*args)
+    except ValueError:
+        return 'ValueError'
+
+
+@pytest.mark.parametrize(
+    'time_str',
+    [f'{hour}:{minute} {period}' for hour, minute, period in product(HOURS, MINUTES, PERIODS)]
+    + MALFORMED_TIMES,
+)
+def test_convert_matches_strptime(time_str):
+    day = date(2025, 6, 2)
+
+    converted = convert_or_error(_convert_cached, time_str, day.toordinal())
+
+    assert converted == convert_or_error(strptime_to_utc, time_str, day)
+
+
+@pytest.mark.parametrize('time_str', ['٧:30 PM', '7:٣٠ PM', '7:3٥ PM', '１:30 PM'])
+def test_convert_rejects_non_ascii_digits(time_str):
+    # strptime lets '\d' match any Unicode digit in the minutes, the page only uses ASCII
+    with pytest.raises(ValueError):
+        _convert_cached(time_str, date(2025, 6, 2).toordinal())
+
+
+def test_get_current_date_is_cached_until_midnight(monkeypatch):
+    clock = SimpleNamespace(now=datetime(2025, 3, 8, 23, 59, 59).timestamp())
+    today = SimpleNamespace(value=date(2025, 3, 8))
+
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return today.value
+
+    monkeypatch.setattr(utils, 'time', SimpleNamespace(time=lambda: clock.now))
+    monkeypatch.setattr(utils, 'date', FakeDate)
+    monkeypatch.setattr(utils, '_DATE_CACHE', [0.0, ''])
+
+    assert get_current_date() == '03-08-2025'
+
+    # Before midnight the cached string is returned without reading the date again
+    today.value = date(2025, 3, 9)
+    assert get_current_date() == '03-08-2025'
+
+    clock.now = datetime(2025, 3, 9).timestamp()
+    assert get_current_date() == '03-09-2025'
+
+
+@pytest.mark.parametrize(
+    ('day', 'before_change', 'after_change'),
+    [
+        (date(2025, 3, 9), '2025-03-09T06:30:00+00:00', '2025-03-09T07:30:00+00:00'),
+        (date(2025, 11, 2), '2025-11-02T05:30:00+00:00', '2025-11-02T08:30:00+00:00'),
+    ],
+)
+def test_convert_on_dst_change_days(day, before_change, after_change):
+    times = [
+        f'{hour}:{minute:02d} {period}'
+        for period in ('AM', 'PM')
+        for hour in range(1, 13)
+        for minute in range(60)
+    ]
+
+    converted = [_convert_cached(time_str, day.toordinal()) for time_str in times]
+
+    assert converted == [strptime_to_utc(time_str, day) for time_str in times]
+    # Times on either side of the 2 AM change get different offsets
+    assert _convert_cached('1:30 AM', day.toordinal()) == before_change
+    assert _convert_cached('3:30 AM', day.toordinal()) == after_change